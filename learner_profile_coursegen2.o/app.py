@@ -3,7 +3,6 @@
 import streamlit as st
 from database import SessionLocal
 from models import Course, Quiz, LearnerProfile
-from parser import parse_file
 from course_generator import generate_course_from_topic
 from quiz_generator import generate_quiz
 from utils import save_course_to_disk, save_quiz_to_disk
@@ -75,7 +74,7 @@ def tts_play(text, lang="en"):
 # UI INPUTS FOR COURSE GENERATION
 topic = st.text_input("Enter topic name")
 file = st.file_uploader("Upload file (PDF/DOCX)", type=["pdf", "docx"])
-url = st.text_input("Or enter URL (optional -- not implemented)")
+url = st.text_input("Or enter URL(s), separated by spaces")
 
 st.subheader("Learner Profile")
 name = st.text_input("Name")
@@ -95,12 +94,7 @@ if generate_course_btn:
     if not topic:
         st.error("Please enter a topic name.")
         st.stop()
-    if file:
-        content = parse_file(file)  # Extract text from uploaded file
-    elif url:
-        st.error("URL parsing not implemented.")
-        st.stop()
-    else:
+    if not file and not url:
         st.error("Please upload a file or enter a URL")
         st.stop()
 
@@ -115,11 +109,29 @@ if generate_course_btn:
         time_availability=time_availability,
     )
 
+    # Reuse sections of the latest course on this topic for unchanged source chunks
+    previous_course = db.query(Course).filter(Course.topic == topic).order_by(Course.id.desc()).first()
+    previous_outline = previous_course.outline if previous_course else None
+
+    # Explicit button press: bypass the generator's rerun guard
+    st.session_state['course_generated'] = False
+
     # Call course generation function, unpack text output only
-    course_content, _ = generate_course_from_topic(topic, learner_profile.to_dict(), content)
+    # Uploads are parsed once per distinct file (see ingest_cache.py)
+    if file:
+        course_content, _ = generate_course_from_topic(
+            topic, learner_profile.to_dict(), source_type="file", file=file,
+            previous_outline=previous_outline,
+        )
+    else:
+        urls = url.split()  # Fetched concurrently by the generator; commas are legal inside URLs
+        course_content, _ = generate_course_from_topic(
+            topic, learner_profile.to_dict(), source_type="web url", url=urls,
+            previous_outline=previous_outline,
+        )
 
-    # Save new course in DB
-    new_course = Course(topic=topic, outline={}, content=str(course_content))
+    # Save new course in DB, with per-chunk provenance for later incremental updates
+    new_course = Course(topic=topic, outline=st.session_state.course_outline or {}, content=str(course_content))
     db.add(new_course)
     db.commit()
     db.refresh(new_course)
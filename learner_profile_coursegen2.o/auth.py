@@ -1,13 +1,25 @@
+import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
 import bcrypt
 
+# bcrypt cost factor; raising it makes existing hashes get upgraded on next login
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# Upper bound on concurrent bcrypt calls, so a login burst can't starve the app
+AUTH_MAX_WORKERS = int(os.getenv("AUTH_MAX_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+
 class Auth:
     @staticmethod
-    def hash_password(plain_password: str) -> str:
+    def hash_password(plain_password: str, rounds: int = BCRYPT_ROUNDS) -> str:
         """
         Hash a plaintext password for storing.
         Returns the hashed password as a string.
         """
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=rounds)
         hashed = bcrypt.hashpw(plain_password.encode('utf-8'), salt)
         return hashed.decode('utf-8')
 
@@ -18,3 +30,68 @@ class Auth:
         Returns True if match, else False.
         """
         return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+    @staticmethod
+    def hash_rounds(hashed_password: str) -> int:
+        """
+        Read the cost factor from a stored hash ("$2b$<rounds>$...").
+        """
+        return int(hashed_password.split("$")[2])
+
+
+class AuthService:
+    """
+    Runs bcrypt on a dedicated, bounded thread pool behind an async API.
+    Use get_auth_service() rather than constructing one per session or rerun,
+    so the whole process shares a single pool.
+    """
+
+    def __init__(self, rounds: int = BCRYPT_ROUNDS, max_workers: int = AUTH_MAX_WORKERS):
+        self.rounds = rounds
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+
+    async def _run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, fn, *args)
+
+    async def hash_password(self, plain_password: str) -> str:
+        return await self._run(Auth.hash_password, plain_password, self.rounds)
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(Auth.verify_password, plain_password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return Auth.hash_rounds(hashed_password) != self.rounds
+
+    async def login(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a login attempt.
+        Returns (ok, new_hash); new_hash is set when the stored hash used a different
+        cost factor and should be replaced by the caller.
+        """
+        if not await self.verify_password(plain_password, hashed_password):
+            return False, None
+        if self.needs_rehash(hashed_password):
+            return True, await self.hash_password(plain_password)
+        return True, None
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+
+_auth_service: Optional[AuthService] = None
+_auth_service_lock = threading.Lock()
+
+
+def get_auth_service() -> AuthService:
+    """
+    Return the process-wide AuthService, building it on first use.
+    This is the entry point for callers; it keeps bcrypt concurrency bounded
+    by AUTH_MAX_WORKERS across all Streamlit sessions.
+    """
+    global _auth_service
+    if _auth_service is None:
+        with _auth_service_lock:
+            if _auth_service is None:
+                _auth_service = AuthService()
+    return _auth_service
@@ -0,0 +1,47 @@
+"""
+Login throughput benchmark: sequential Auth.verify_password vs AuthService under
+a burst of concurrent logins, using the shared service from get_auth_service().
+
+    BCRYPT_ROUNDS=12 AUTH_MAX_WORKERS=4 python bench_auth.py --users 64
+"""
+import time
+import asyncio
+import argparse
+
+from auth import AUTH_MAX_WORKERS, Auth, get_auth_service
+
+
+def bench_sequential(password, hashed, users):
+    start = time.perf_counter()
+    for _ in range(users):
+        Auth.verify_password(password, hashed)
+    return time.perf_counter() - start
+
+
+async def bench_service(service, password, hashed, users):
+    start = time.perf_counter()
+    results = await asyncio.gather(*(service.login(password, hashed) for _ in range(users)))
+    elapsed = time.perf_counter() - start
+    assert all(ok for ok, _ in results)
+    return elapsed
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--users", type=int, default=64, help="concurrent logins in the burst")
+    args = ap.parse_args()
+
+    service = get_auth_service()
+    password = "correct horse battery staple"
+    hashed = Auth.hash_password(password, rounds=service.rounds)
+
+    seq = bench_sequential(password, hashed, args.users)
+    pooled = asyncio.run(bench_service(service, password, hashed, args.users))
+
+    print(f"{args.users} logins, rounds={service.rounds}, workers={AUTH_MAX_WORKERS}")
+    print(f"  sequential : {seq:7.2f}s  {args.users / seq:7.1f} logins/s")
+    print(f"  AuthService: {pooled:7.2f}s  {args.users / pooled:7.1f} logins/s")
+
+
+if __name__ == "__main__":
+    main()
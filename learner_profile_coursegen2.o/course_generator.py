@@ -1,4 +1,6 @@
 import os
+import json
+import hashlib
 import tempfile
 import logging
 from pathlib import Path
@@ -8,6 +10,9 @@ import time
 import groq
 from groq import Groq
 from langchain.prompts import PromptTemplate
+from url_ingest import fetch_url_texts
+from ingest_cache import ingest_upload
+from utils import chunk_text
 
 # ------------------- CONFIGURATION -------------------
 load_dotenv()
@@ -21,37 +26,23 @@ groq_client = Groq(api_key=GROQ_API_KEY)
 
 # ------------------- FILE & WEB EXTRACTION -------------------
 def _extract_text_from_file(file, chunk_size=3000):
-    import fitz
-
-    text = ""
-    file_ext = Path(file.name).suffix.lower()
-    if file_ext == ".pdf":
-        pdf_doc = fitz.open(stream=file.read(), filetype="pdf")
-        for page in pdf_doc:
-            text += page.get_text()
-    else:
-        text = file.read().decode("utf-8", errors="ignore")
-
-    # Split text into chunks of chunk_size
-    chunks = [text[i:i+chunk_size] for i in range(0, len(text), chunk_size)]
+    """Chunk an uploaded file, skipping parsing for bytes seen before."""
+    _, _, chunks = ingest_upload(file, chunk_size)
     return chunks
 
-def _extract_text_from_url(url):
-    """Extract up to 3000 chars of visible text from a webpage."""
-    import requests
-    from bs4 import BeautifulSoup
-
-    try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
-        text = " ".join(p.get_text() for p in soup.find_all("p"))
-    except Exception as e:
-        logging.error(f"Error fetching URL: {url} — {e}", exc_info=True)
-        st.error(f"❌ Failed to fetch URL: {e}")
-        text = ""
-
-    return text[:3000]
+def _extract_text_from_urls(urls, chunk_size=3000):
+    """Fetch all URLs concurrently and chunk their main text like file content."""
+    if isinstance(urls, str):
+        urls = [urls]
+
+    texts = fetch_url_texts(urls)
+    chunks = []
+    for url, text in zip(urls, texts):
+        if not text:
+            st.error(f"❌ Failed to fetch URL: {url}")
+            continue
+        chunks.extend(chunk_text(text, chunk_size))
+    return chunks
 
 # ------------------- MODEL GENERATION -------------------
 def generate_with_groq_with_retries(prompt, placeholder=None, retries=3):
@@ -185,13 +176,34 @@ Please create the complete, well-structured course now.
 """
     return PromptTemplate.from_template(template).format(topic=topic, context=context)
 
+# ------------------- SECTION PROVENANCE -------------------
+def chunk_hash(chunk):
+    return hashlib.sha256(chunk.encode("utf-8")).hexdigest()
+
+def _profile_hash(topic, learner_profile):
+    # Sections are only reusable when the prompt around the chunk is unchanged
+    return hashlib.sha256(json.dumps([topic, learner_profile], sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+def _reusable_sections(previous_outline, topic, learner_profile):
+    """Map chunk hash -> section text from a previously generated course outline."""
+    if not previous_outline or previous_outline.get("profile_hash") != _profile_hash(topic, learner_profile):
+        return {}
+    return {s["chunk_hash"]: s["text"] for s in previous_outline.get("sections", [])}
+
 # ------------------- MAIN FUNCTION -------------------
-def generate_course_from_topic(topic, learner_profile, source_type="file", file=None, url=None, placeholder=None):
+def generate_course_from_topic(topic, learner_profile, source_type="file", file=None, url=None, placeholder=None, previous_outline=None):
+    """
+    Generate a course section per source chunk.
+    When previous_outline (a stored Course.outline) is given, the LLM is only called
+    for chunks whose hash is not in it; the rest reuse the stored section text.
+    The new outline is left in st.session_state['course_outline'].
+    """
     # Initialize session state flag to avoid regenerating multiple times
     if 'course_generated' not in st.session_state:
         st.session_state['course_generated'] = False
         st.session_state['course_content'] = None
         st.session_state['course_file_path'] = None
+        st.session_state['course_outline'] = None
 
     # Only generate if not done yet
     if st.session_state['course_generated']:
@@ -201,16 +213,21 @@ def generate_course_from_topic(topic, learner_profile, source_type="file", file=
     if source_type.lower() == "file" and file:
         text_chunks = _extract_text_from_file(file)
     elif source_type.lower() == "web url" and url:
-        text = _extract_text_from_url(url)
-        text_chunks = [text]
+        text_chunks = _extract_text_from_urls(url) or [""]
     else:
         text_chunks = [""]
 
+    previous_sections = _reusable_sections(previous_outline, topic, learner_profile)
+    sections = []
     full_course_text = ""
     chunk_index = 1
     for chunk in text_chunks:
-        prompt = get_prompt(topic, chunk, learner_profile)
-        partial_text = generate_with_groq_with_retries(prompt, placeholder)
+        key = chunk_hash(chunk)
+        partial_text = previous_sections.get(key)
+        if partial_text is None:
+            prompt = get_prompt(topic, chunk, learner_profile)
+            partial_text = generate_with_groq_with_retries(prompt, placeholder)
+        sections.append({"chunk_hash": key, "text": partial_text})
         full_course_text += f"\n\n<!-- Section {chunk_index} -->\n\n{partial_text}"
         chunk_index += 1
 
@@ -227,6 +244,10 @@ def generate_course_from_topic(topic, learner_profile, source_type="file", file=
     st.session_state['course_generated'] = True
     st.session_state['course_content'] = full_course_text
     st.session_state['course_file_path'] = str(file_path)
+    st.session_state['course_outline'] = {
+        "profile_hash": _profile_hash(topic, learner_profile),
+        "sections": sections,
+    }
 
     return full_course_text, str(file_path)
 
@@ -0,0 +1,121 @@
+import os
+import json
+import shutil
+import hashlib
+import logging
+import pathlib
+from typing import List, Optional, Tuple
+
+from parser import parse_file
+from utils import CHUNKER_VERSION, DATA_DIR, chunk_text, write_text_atomic
+
+INGEST_CACHE_DIR = DATA_DIR / "ingest_cache"
+INGEST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+# Least recently used entries beyond this count are evicted from disk
+INGEST_CACHE_MAX_ENTRIES = int(os.getenv("INGEST_CACHE_MAX_ENTRIES", "50"))
+
+# ------------------- CACHE ENTRIES -------------------
+def upload_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _bounds_key(chunk_size: int) -> str:
+    return f"{CHUNKER_VERSION}:{chunk_size}"
+
+
+def _entry_dir(digest: str) -> pathlib.Path:
+    return INGEST_CACHE_DIR / digest
+
+
+def _touch(entry: pathlib.Path) -> None:
+    # Directory mtime doubles as the LRU timestamp
+    try:
+        os.utime(entry)
+    except OSError:
+        pass  # Evicted by another session meanwhile
+
+
+def _mtime_or_none(path: pathlib.Path) -> Optional[float]:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+def _evict(max_entries: int = INGEST_CACHE_MAX_ENTRIES) -> None:
+    entries = []
+    for entry in INGEST_CACHE_DIR.iterdir():
+        mtime = _mtime_or_none(entry)
+        if mtime is not None and entry.is_dir():  # Skip entries another session just removed
+            entries.append((mtime, entry))
+    entries.sort()
+    for _, entry in entries[:max(len(entries) - max_entries, 0)]:
+        shutil.rmtree(entry, ignore_errors=True)
+
+
+def load_entry(digest: str, chunk_size: int) -> Optional[Tuple[str, List[str]]]:
+    """Return cached (text, chunks) for an upload, or None on a miss."""
+    entry = _entry_dir(digest)
+    try:
+        meta = json.loads((entry / "meta.json").read_text(encoding="utf-8"))
+        text = (entry / "text.txt").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logging.error(f"Corrupt ingest cache entry {digest} — {e}", exc_info=True)
+        return None
+
+    bounds = meta.get("bounds", {}).get(_bounds_key(chunk_size))
+    if bounds and bounds[-1][1] != len(text):
+        bounds = None  # Bounds don't cover this text; re-chunk rather than serve short chunks
+    if bounds is None:
+        # Text is cached but not yet chunked at this size (or by this chunker version)
+        chunks = chunk_text(text, chunk_size)
+        try:
+            _store_bounds(entry, meta, chunk_size, chunks)
+        except OSError as e:
+            logging.error(f"Error writing ingest cache bounds {digest} — {e}", exc_info=True)
+    else:
+        chunks = [text[start:end] for start, end in bounds]
+    _touch(entry)
+    return text, chunks
+
+
+def _store_bounds(entry: pathlib.Path, meta: dict, chunk_size: int, chunks: List[str]) -> None:
+    bounds, start = [], 0
+    for chunk in chunks:
+        bounds.append([start, start + len(chunk)])
+        start += len(chunk)
+    meta.setdefault("bounds", {})[_bounds_key(chunk_size)] = bounds
+    write_text_atomic(entry / "meta.json", json.dumps(meta))
+
+
+def store_entry(digest: str, text: str, chunk_size: int, chunks: List[str]) -> None:
+    entry = _entry_dir(digest)
+    try:
+        entry.mkdir(parents=True, exist_ok=True)
+        # Text first, meta last: bounds are only published once their text is in place
+        write_text_atomic(entry / "text.txt", text)
+        _store_bounds(entry, {"digest": digest}, chunk_size, chunks)
+    except Exception as e:
+        logging.error(f"Error writing ingest cache entry {digest} — {e}", exc_info=True)
+        return
+    _evict()
+
+# ------------------- INGESTION -------------------
+def ingest_upload(uploaded_file, chunk_size: int = 3000) -> Tuple[str, str, List[str]]:
+    """
+    Parse and chunk an uploaded document, reusing earlier work for identical bytes.
+    Returns (digest, text, chunks).
+    """
+    digest = upload_digest(uploaded_file.getvalue())
+    cached = load_entry(digest, chunk_size)
+    if cached is not None:
+        return (digest,) + cached
+
+    uploaded_file.seek(0)
+    text = parse_file(uploaded_file)
+    chunks = chunk_text(text, chunk_size)
+    store_entry(digest, text, chunk_size, chunks)
+    return digest, text, chunks
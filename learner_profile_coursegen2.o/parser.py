@@ -18,5 +18,7 @@ def parse_file(uploaded_file):
         return parse_pdf(uploaded_file)
     elif uploaded_file.type in ["application/vnd.openxmlformats-officedocument.wordprocessingml.document", "application/msword"]:
         return parse_docx(uploaded_file)
+    elif uploaded_file.type == "text/plain":
+        return uploaded_file.read().decode("utf-8", errors="ignore")
     else:
         raise Exception(f"Unsupported file type: {uploaded_file.type}")
@@ -0,0 +1,161 @@
+import os
+import re
+import json
+import asyncio
+import hashlib
+import logging
+import pathlib
+from typing import Iterable, List, Optional, Tuple
+
+import httpx
+from selectolax.lexbor import LexborHTMLParser
+
+from utils import DATA_DIR, write_text_atomic
+
+HTTP_CACHE_DIR = DATA_DIR / "http_cache"
+HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+# Least recently used pages beyond this count are evicted from disk
+HTTP_CACHE_MAX_ENTRIES = int(os.getenv("HTTP_CACHE_MAX_ENTRIES", "200"))
+
+# Elements that never carry the main content of a page
+NOISE_TAGS = ["script", "style", "noscript", "svg", "nav", "header", "footer", "aside", "form", "iframe"]
+
+# Elements that start a new line of text; inline markup (<b>, <sub>, ...) joins words
+BLOCK_TAGS = "p, div, section, li, ul, ol, dd, dt, h1, h2, h3, h4, h5, h6, tr, td, th, pre, blockquote, br"
+
+# ------------------- HTTP CACHE -------------------
+def _cache_paths(url: str) -> Tuple[pathlib.Path, pathlib.Path]:
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return HTTP_CACHE_DIR / f"{key}.json", HTTP_CACHE_DIR / f"{key}.html"
+
+
+def _body_hash(body: str) -> str:
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def _load_cached(url: str) -> Tuple[Optional[dict], Optional[str]]:
+    meta_path, body_path = _cache_paths(url)
+    if not (meta_path.exists() and body_path.exists()):
+        return None, None
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        body = body_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None, None  # Evicted by another session meanwhile
+    except Exception as e:
+        logging.error(f"Corrupt HTTP cache entry for {url} — {e}", exc_info=True)
+        return None, None
+    if meta.get("body_sha256") != _body_hash(body):
+        return None, None  # Read across a concurrent rewrite; validators may not match this body
+    _touch(meta_path)
+    return meta, body
+
+
+def _touch(meta_path: pathlib.Path) -> None:
+    # Meta file mtime doubles as the LRU timestamp
+    try:
+        os.utime(meta_path)
+    except OSError:
+        pass
+
+
+def _mtime_or_none(path: pathlib.Path) -> Optional[float]:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+def _evict(max_entries: int = HTTP_CACHE_MAX_ENTRIES) -> None:
+    entries = []
+    for meta_path in HTTP_CACHE_DIR.glob("*.json"):
+        mtime = _mtime_or_none(meta_path)
+        if mtime is not None:  # Skip entries another session just removed
+            entries.append((mtime, meta_path))
+    entries.sort()
+    for _, meta_path in entries[:max(len(entries) - max_entries, 0)]:
+        for path in (meta_path, meta_path.with_suffix(".html")):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+def _store_cached(url: str, response: httpx.Response) -> None:
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not (etag or last_modified):
+        return  # Nothing to revalidate against next time
+    meta_path, body_path = _cache_paths(url)
+    body = response.text
+    try:
+        # Body first, meta last: validators are only published once their body is in place
+        write_text_atomic(body_path, body)
+        write_text_atomic(
+            meta_path,
+            json.dumps({
+                "url": url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "body_sha256": _body_hash(body),
+            }),
+        )
+    except Exception as e:
+        logging.error(f"Error writing HTTP cache for {url} — {e}", exc_info=True)
+        return
+    _evict()
+
+# ------------------- TEXT EXTRACTION -------------------
+def extract_main_text(html: str) -> str:
+    """Extract readable text from the main content area of an HTML page."""
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(NOISE_TAGS)
+    root = tree.css_first("main") or tree.css_first("article") or tree.body or tree.root
+    if root is None:
+        return ""
+    for node in root.css(BLOCK_TAGS):
+        node.insert_after("\n")
+    text = root.text(separator="")
+    return re.sub(r"\s+", " ", text).strip()
+
+# ------------------- FETCHING -------------------
+async def _fetch_one(client: httpx.AsyncClient, url: str) -> str:
+    meta, cached_body = _load_cached(url)
+    headers = {}
+    if meta:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        response = await client.get(url, headers=headers)
+        if response.status_code == 304 and cached_body is not None:
+            return extract_main_text(cached_body)
+        response.raise_for_status()
+    except Exception as e:
+        logging.error(f"Error fetching URL: {url} — {e}", exc_info=True)
+        # Serve a stale copy rather than nothing if we have one
+        return extract_main_text(cached_body) if cached_body is not None else ""
+
+    _store_cached(url, response)
+    return extract_main_text(response.text)
+
+
+async def fetch_urls(urls: Iterable[str], max_connections: int = 10, timeout: float = 15.0) -> List[str]:
+    """
+    Fetch several URLs concurrently over one pooled client.
+    Returns the extracted text per URL, in input order ("" for failures).
+    """
+    urls = list(urls)
+    if not urls:
+        return []
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    async with httpx.AsyncClient(limits=limits, timeout=timeout, follow_redirects=True) as client:
+        return await asyncio.gather(*(_fetch_one(client, url) for url in urls))
+
+
+def fetch_url_texts(urls: Iterable[str], **kwargs) -> List[str]:
+    """Blocking wrapper around `fetch_urls` for Streamlit script threads."""
+    return asyncio.run(fetch_urls(urls, **kwargs))
@@ -1,9 +1,10 @@
 import os
 import re
-import requests
+import zlib
 import pathlib
 import datetime
-from typing import Optional, Union
+import tempfile
+from typing import List, Optional, Union
 
 DATA_DIR = pathlib.Path("data")
 COURSES_DIR = DATA_DIR / "courses"
@@ -24,19 +25,59 @@ def extract_context(source_type: str, file: Optional[Union[bytes, object]] = Non
             return f"[Could not read file: {e}]"
 
     elif source_type.lower() == "url" and url:
-        try:
-            response = requests.get(url, timeout=15)
-            response.raise_for_status()
-            text = response.text
-            text = re.sub(r"<[^>]+>", " ", text)
-            text = re.sub(r"\s+", " ", text)
-            return text.strip()
-        except Exception as e:
-            return f"[Could not fetch URL: {e}]"
+        from url_ingest import fetch_url_texts  # url_ingest imports DATA_DIR from here
+
+        text = fetch_url_texts([url])[0]
+        return text if text else "[Could not fetch URL]"
 
     return ""
 
 
+def write_text_atomic(path: pathlib.Path, text: str) -> None:
+    """Write text via a temp file and os.replace, so readers never see a partial file."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+# Bump whenever chunk_text's cut rules change; cached chunk bounds are keyed by it
+CHUNKER_VERSION = "cdc1"
+
+
+def chunk_text(text: str, chunk_size: int = 3000) -> List[str]:
+    """
+    Split text into chunks of at most chunk_size characters.
+    Cuts fall on line/sentence ends chosen by content, so an edit only changes
+    the chunks around it and later chunks keep the same text (and hash).
+    Joining the chunks gives back the original text.
+    """
+    units = []
+    for unit in re.split(r"(?<=\n)|(?<=[.!?] )", text):
+        # Hard-split anything that cannot fit in a single chunk
+        units.extend(unit[i:i+chunk_size] for i in range(0, len(unit), chunk_size))
+
+    chunks, current = [], ""
+    for unit in units:
+        if current and len(current) + len(unit) > chunk_size:
+            chunks.append(current)
+            current = ""
+        current += unit
+        if len(current) >= chunk_size // 2 and zlib.crc32(unit.encode("utf-8")) % 8 == 0:
+            chunks.append(current)
+            current = ""
+    if current:
+        chunks.append(current)
+    return chunks
+
+
 def timestamp_slug() -> str:
     return datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
 